@@ -1,6 +1,27 @@
+from functools import lru_cache
+
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy.ndimage import distance_transform_edt
+
+
+@lru_cache(maxsize=64)
+def get_distance_mask(tile_shape: tuple[int, int]) -> ArrayLike:
+    """
+    Distance of every pixel to the border of a tile, starting at 1 on the
+    border.
+    The result is cached per tile shape and returned read-only as uint16,
+    callers accumulating weights have to widen it.
+    tile_shape: tuple[int, int], (ny, nx) of the tile
+    """
+    ny, nx = tile_shape
+    # The closest border pixel is always straight up, down, left or right.
+    y = np.arange(ny, dtype="uint16")
+    x = np.arange(nx, dtype="uint16")
+    dist_y = np.minimum(y, y[::-1])[:, np.newaxis]
+    dist_x = np.minimum(x, x[::-1])[np.newaxis, :]
+    dist_map = np.minimum(dist_y, dist_x) + 1
+    dist_map.setflags(write=False)
+    return dist_map
 
 
 def fuse_random_gradient(
@@ -15,29 +36,31 @@ def fuse_random_gradient(
     """
     np.random.seed(random_seed)
     ny_tot, nx_tot = positions.max(axis=0) + tiles.shape[-2:]
-    im_fused = np.zeros((len(tiles), ny_tot, nx_tot), dtype=tiles.dtype)
-    im_weight = np.zeros_like(im_fused, dtype="uint16")
     ny_tile, nx_tile = tiles.shape[-2:]
 
     # distance map to border of image
-    mask = np.ones((ny_tile, nx_tile))
-    mask[[0, -1], :] = 0
-    mask[:, [0, -1]] = 0
-    dist_map = distance_transform_edt(mask).astype("uint32") + 1
-
-    for i in range(len(tiles)):
-        tile = tiles[i]
-        pos = positions[i]
-        im_fused[i, pos[0] : pos[0] + ny_tile, pos[1] : pos[1] + nx_tile] += tile
-        im_weight[i, pos[0] : pos[0] + ny_tile, pos[1] : pos[1] + nx_tile] += dist_map
+    dist_map = get_distance_mask((ny_tile, nx_tile))
+
+    im_weight = np.zeros((len(tiles), ny_tot, nx_tot), dtype="uint16")
+    for i, pos in enumerate(positions):
+        im_weight[i, pos[0] : pos[0] + ny_tile, pos[1] : pos[1] + nx_tile] = dist_map
     im_weight[:, im_weight.max(axis=0) == 0] = 1
     im_weight = im_weight / im_weight.sum(axis=0)[np.newaxis, :, :]
     im_weight = np.cumsum(im_weight, axis=0)
-    im_weight = np.insert(im_weight, 0, np.zeros_like(im_weight[0]), axis=0)
-    im_rand = np.random.rand(*im_fused[0].shape)
-    for i in range(len(im_fused)):
-        im_fused[i, (im_rand < im_weight[i]) | (im_weight[i + 1] < im_rand)] = 0
-    return im_fused.sum(axis=0)
+
+    # pick the first tile whose cumulative weight reaches the random value,
+    # pixels beyond the last cumulative weight (rounding) stay empty
+    im_rand = np.random.rand(ny_tot, nx_tot)
+    reached = im_weight >= im_rand
+    selected = np.argmax(reached, axis=0)
+    selected[~reached[-1]] = len(tiles)
+
+    # same output dtype as summing the tiles, e.g. uint64 for uint8 tiles
+    im_fused = np.zeros((ny_tot, nx_tot), dtype=tiles[:0].sum().dtype)
+    for i, (tile, pos) in enumerate(zip(tiles, positions)):
+        region = np.s_[pos[0] : pos[0] + ny_tile, pos[1] : pos[1] + nx_tile]
+        np.copyto(im_fused[region], tile, where=selected[region] == i)
+    return im_fused
 
 
 def fuse_fw(tiles: ArrayLike, positions: ArrayLike) -> ArrayLike:
@@ -70,7 +93,7 @@ def fuse_rev(tiles: ArrayLike, positions: ArrayLike) -> ArrayLike:
     im_fused = np.zeros((ny_tot, nx_tot), dtype=tiles.dtype)
     ny_tile, nx_tile = tiles.shape[-2:]
 
-    for tile, pos in reversed(list(zip(tiles, positions))):
+    for tile, pos in zip(tiles[::-1], positions[::-1]):
         im_fused[pos[0] : pos[0] + ny_tile, pos[1] : pos[1] + nx_tile] = tile
 
     return im_fused
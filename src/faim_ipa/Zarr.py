@@ -6,9 +6,10 @@ from zarr import Group
 
 
 def _copy_multiscales_metadata(parent_group, subgroup):
-    datasets = parent_group.attrs.asdict()["multiscales"][0]["datasets"]
-    axes = parent_group.attrs.asdict()["multiscales"][0]["axes"]
-    write_multiscales_metadata(subgroup, datasets=datasets, axes=axes)
+    multiscales = parent_group.attrs.asdict()["multiscales"][0]
+    write_multiscales_metadata(
+        subgroup, datasets=multiscales["datasets"], axes=multiscales["axes"]
+    )
 
 
 def write_labels_to_group(
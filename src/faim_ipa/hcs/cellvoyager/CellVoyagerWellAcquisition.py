@@ -79,6 +79,11 @@ class CellVoyagerWellAcquisition(WellAcquisition):
             else:
                 tiles[tczyx_index].append(row)
 
+        # Look up channel metadata by index instead of comparing the whole
+        # "Ch" column for every tile.
+        channel_metadata = self._metadata.drop_duplicates("Ch").set_index("Ch")
+        yx_spacing = self.get_yx_spacing()
+
         stacked_tiles = []
         for tczyx_index, rows in tiles.items():
             row_dict = {}
@@ -102,15 +107,13 @@ class CellVoyagerWellAcquisition(WellAcquisition):
             channel = tczyx_index[1]
             y, x = tczyx_index[3], tczyx_index[4]
 
-            ch_metadata = self._metadata[self._metadata["Ch"] == channel].iloc[0]
+            ch_metadata = channel_metadata.loc[channel]
             shape = (
                 len(files),
                 int(ch_metadata["VerticalPixels"]),
                 int(ch_metadata["HorizontalPixels"]),
             )
 
-            yx_spacing = self.get_yx_spacing()
-
             bgcm = None
             if self._background_correction_matrices is not None:
                 bgcm = self._background_correction_matrices[str(channel)]
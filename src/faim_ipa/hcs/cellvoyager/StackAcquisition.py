@@ -66,12 +66,13 @@ class StackAcquisition(PlateAcquisition):
 
     def _build_well_acquisitions(self, files: pd.DataFrame) -> list[WellAcquisition]:
         wells = []
-        for well in tqdm(files["well"].unique()):
+        metadata = self._parse_metadata()
+        for _, well_files in tqdm(files.groupby("well", sort=False)):
             wells.append(
                 CellVoyagerWellAcquisition(
-                    files=files[files["well"] == well],
+                    files=well_files,
                     alignment=self._alignment,
-                    metadata=self._parse_metadata(),
+                    metadata=metadata,
                     background_correction_matrices=self._background_correction_matrices,
                     illumination_correction_matrices=self._illumination_correction_matrices,
                     n_planes_in_stacked_tile=self._n_planes_in_stacked_tile,
@@ -43,30 +43,10 @@ class ZAdjustedStackAcquisition(StackAcquisition):
             merged[merged["ZIndex"].astype(int) == 2]["Z"].astype(float)
         ) - np.mean(merged[merged["ZIndex"].astype(int) == 1]["Z"].astype(float))
         # Shift ZIndex for each field in each well according to the auto-focus value
-        for well in merged["well"].unique():
-            for field in merged[merged["well"] == well]["FieldIndex"].unique():
-                for ch in merged.query(f"well == '{well}' & FieldIndex == '{field}'")[
-                    "Ch"
-                ].unique():
-                    z_index_offset = int(
-                        np.round(
-                            (
-                                np.min(
-                                    merged.query(
-                                        f"well == '{well}' & FieldIndex == '{field}' & Ch == '{ch}'"
-                                    )["z_pos"]
-                                )
-                                - min_z
-                            )
-                            / z_spacing
-                        )
-                    )
-                    merged.loc[
-                        (merged["well"] == well)
-                        & (merged["FieldIndex"] == field)
-                        & (merged["Ch"] == ch),
-                        "ZIndex",
-                    ] += z_index_offset
+        field_min_z = merged.groupby(["well", "FieldIndex", "Ch"], sort=False)[
+            "z_pos"
+        ].transform("min")
+        merged["ZIndex"] += np.round((field_min_z - min_z) / z_spacing).astype(int)
 
         # Start at 0
         merged["ZIndex"] = merged["ZIndex"] - merged["ZIndex"].min()
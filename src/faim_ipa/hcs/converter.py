@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 from pathlib import Path
 from typing import Callable, Optional, Union
@@ -123,6 +124,7 @@ class ConvertToNGFFPlate:
         max_layer: int = 3,
         storage_options: dict = None,
         build_acquisition_mask: bool = False,
+        max_parallel_wells: int = 1,
     ):
         """
         Convert a plate acquisition to an NGFF plate.
@@ -141,6 +143,13 @@ class ConvertToNGFFPlate:
             Zarr storage options.
         build_acquisition_mask :
             Writes a boolean mask instead of the image data, indicating where the image data is present.
+        max_parallel_wells :
+            Number of wells which are written at the same time. With the
+            default of 1 the wells are created and written one after the
+            other. With more, all well groups are created first and the
+            wells are then stitched and written from a thread pool, which
+            overlaps the per-well reading and writing. The output is the
+            same in both cases.
 
         Returns
         -------
@@ -152,36 +161,105 @@ class ConvertToNGFFPlate:
         ), "Chunks must have the same number of dimensions as the tile shape."
         well_acquisitions = plate_acquisition.get_well_acquisitions(wells)
 
-        for well_acquisition in well_acquisitions:
-            well_group = self._create_well_group(
+        spatial_calibration_unit = Unit(
+            plate_acquisition.get_channel_metadata()[0].spatial_calibration_units
+        )
+
+        if max_parallel_wells == 1:
+            for well_acquisition in well_acquisitions:
+                well_group = self._create_well_group(
+                    plate,
+                    well_acquisition,
+                    well_sub_group,
+                    add_to_well_images=not build_acquisition_mask,
+                )
+                self._write_well(
+                    well_group[well_sub_group],
+                    chunks,
+                    max_layer,
+                    plate_acquisition,
+                    storage_options,
+                    well_acquisition,
+                    build_acquisition_mask,
+                    spatial_calibration_unit,
+                )
+            return plate
+
+        # Well groups share their row groups and the plate metadata, create
+        # them one after the other before writing the wells in parallel.
+        groups = [
+            self._create_well_group(
                 plate,
                 well_acquisition,
                 well_sub_group,
                 add_to_well_images=not build_acquisition_mask,
-            )
-            group = well_group[well_sub_group]
-            self._write_stitched_image(
-                group,
-                chunks,
-                plate_acquisition,
-                storage_options,
-                well_acquisition,
-                build_acquisition_mask=build_acquisition_mask,
-            )
-            shapes, datasets = self._build_pyramid(
-                group,
-                chunks,
-                max_layer,
-                storage_options,
-            )
-            self._write_metadata(
-                group, max_layer, shapes, datasets, plate_acquisition, well_acquisition
-            )
+            )[well_sub_group]
+            for well_acquisition in well_acquisitions
+        ]
+        with ThreadPoolExecutor(max_workers=max_parallel_wells) as pool:
+            futures = [
+                pool.submit(
+                    self._write_well,
+                    group,
+                    chunks,
+                    max_layer,
+                    plate_acquisition,
+                    storage_options,
+                    well_acquisition,
+                    build_acquisition_mask,
+                    spatial_calibration_unit,
+                )
+                for group, well_acquisition in zip(groups, well_acquisitions)
+            ]
+            for future in futures:
+                future.result()
 
         return plate
 
+    def _write_well(
+        self,
+        group,
+        chunks,
+        max_layer,
+        plate_acquisition,
+        storage_options,
+        well_acquisition,
+        build_acquisition_mask,
+        spatial_calibration_unit,
+    ):
+        self._write_stitched_image(
+            group,
+            chunks,
+            plate_acquisition,
+            storage_options,
+            well_acquisition,
+            build_acquisition_mask=build_acquisition_mask,
+        )
+        shapes, datasets = self._build_pyramid(
+            group,
+            chunks,
+            max_layer,
+            storage_options,
+        )
+        self._write_metadata(
+            group,
+            max_layer,
+            shapes,
+            datasets,
+            plate_acquisition,
+            well_acquisition,
+            spatial_calibration_unit,
+        )
+
     def _write_metadata(
-        self, group, max_layer, shapes, datasets, plate_acquisition, well_acquisition
+        self,
+        group,
+        max_layer,
+        shapes,
+        datasets,
+        plate_acquisition,
+        well_acquisition,
+        spatial_calibration_unit,
     ):
         coordinate_transformations = well_acquisition.get_coordinate_transformations(
             max_layer=max_layer,
@@ -196,9 +274,6 @@ class ConvertToNGFFPlate:
         for dataset, transform in zip(datasets, coordinate_transformations):
             dataset["coordinateTransformations"] = transform
         axes = Axes(well_acquisition.get_axes(), fmt).to_list()
-        spatial_calibration_unit = Unit(
-            plate_acquisition.get_channel_metadata()[0].spatial_calibration_units
-        )
         for axis in axes:
             if axis["name"] in ["z", "y", "x"]:
                 axis["unit"] = str(spatial_calibration_unit)
@@ -227,8 +302,14 @@ class ConvertToNGFFPlate:
         well_acquisition,
         build_acquisition_mask,
     ):
+        # Stitch in chunks which are binned down to the output chunks, such
+        # that the rechunk below does not have to split and merge blocks.
+        stitch_chunks = tuple(chunks[:-2]) + (
+            chunks[-2] * self._yx_binning,
+            chunks[-1] * self._yx_binning,
+        )
         stitched_well_da = self._stitch_well_image(
-            chunks,
+            stitch_chunks,
             well_acquisition,
             output_shape=plate_acquisition.get_common_well_shape(),
             build_acquisition_mask=build_acquisition_mask,
@@ -334,7 +415,7 @@ class ConvertToNGFFPlate:
     ):
         from faim_ipa.stitching import DaskTileStitcher
 
-        tile_data_ndims = well_acquisition.get_tiles()[0].load_data().ndim
+        tile_data_ndims = len(well_acquisition.get_tiles()[0].shape)
         if tile_data_ndims == 2:
             chunk_shape = (
                 chunks[-2],
@@ -373,7 +454,7 @@ class ConvertToNGFFPlate:
         if add_to_well_images:
             zattrs = well_group.attrs.asdict()
             if "well" in zattrs.keys() and "images" in zattrs["well"].keys():
-                existing_images = well_group.attrs.asdict()["well"]["images"]
+                existing_images = zattrs["well"]["images"]
             else:
                 existing_images = []
             write_well_metadata(
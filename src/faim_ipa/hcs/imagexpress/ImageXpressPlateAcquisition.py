@@ -84,10 +84,10 @@ class ImageXpressPlateAcquisition(PlateAcquisition):
 
     def _build_well_acquisitions(self, files: pd.DataFrame) -> list[WellAcquisition]:
         wells = []
-        for well in tqdm(files["well"].unique()):
+        for _, well_files in tqdm(files.groupby("well", sort=False)):
             wells.append(
                 ImageXpressWellAcquisition(
-                    files=files[files["well"] == well],
+                    files=well_files,
                     alignment=self._alignment,
                     z_spacing=self._get_z_spacing(),
                     background_correction_matrices=self._background_correction_matrices,
@@ -28,9 +28,13 @@ class ImageXpressWellAcquisition(WellAcquisition):
 
     def _assemble_tiles(self) -> list[Tile]:
         tiles = []
-        for i, row in self._files.iterrows():
+        # Channels are named "w<index>", parse the index for all rows at once.
+        files = self._files.assign(
+            channel_index=self._files["channel"].str.slice(1).astype(int)
+        )
+        for row in files.to_dict("records"):
             file = row["path"]
-            time_point = row["t"] if "t" in row.index and row["t"] is not None else 0
+            time_point = row["t"] if "t" in row and row["t"] is not None else 0
             channel = row["channel"]
             metadata = load_metaseries_tiff_metadata(file)
             if self._z_spacing is None:
@@ -52,7 +56,7 @@ class ImageXpressWellAcquisition(WellAcquisition):
                     shape=(metadata["pixel-size-y"], metadata["pixel-size-x"]),
                     position=TilePosition(
                         time=time_point,
-                        channel=int(channel[1:]),
+                        channel=row["channel_index"],
                         z=z,
                         y=int(
                             metadata["stage-position-y"]
@@ -6,7 +6,7 @@ import numpy as np
 from dask import array as da
 from dask.array.core import normalize_chunks
 
-from faim_ipa.stitching import BoundingBox5D, stitching_utils
+from faim_ipa.stitching import stitching_utils
 from faim_ipa.stitching.Tile import Tile
 
 
@@ -46,21 +46,6 @@ class DaskTileStitcher:
         self._n_chunks = self._compute_number_of_chunks()
         self._block_to_tile_map = self._compute_block_to_tile_map()
 
-    def _build_tiles_lut(self):
-        lut = {}
-        for tile in self.tiles:
-            tcz_pos = (
-                tile.position.time,
-                tile.position.channel,
-                tile.position.z,
-            )
-            if tcz_pos in lut.keys():
-                lut[tcz_pos].append(tile)
-            else:
-                lut[tcz_pos] = [tile]
-
-        return lut
-
     def _compute_number_of_chunks(self):
         """
         Compute the number of chunks (blocks) in the stitched image.
@@ -72,24 +57,35 @@ class DaskTileStitcher:
     def _compute_block_to_tile_map(self):
         """
         Compute a map from block position to tiles that overlap with the block.
+
+        Every tile is inserted into the blocks spanned by its yx-extent.
+        Tiles are only placed into blocks which start at the same
+        (time, channel, z) position as the tile.
         """
-        tiles_lut = self._build_tiles_lut()
-        block_to_tile_map = {}
-        for block_position in np.ndindex(self._n_chunks):
-            block_to_tile_map[block_position] = []
-            block_bbox = BoundingBox5D.from_pos_and_shape(
-                position=tuple(block_position * np.array(self.chunk_shape)),
-                shape=self.chunk_shape,
+        block_to_tile_map = {
+            block_position: [] for block_position in np.ndindex(self._n_chunks)
+        }
+        chunk_shape = np.array(self.chunk_shape)
+        n_chunks = np.array(self._n_chunks)
+        for tile in self.tiles:
+            start = np.array(tile.get_position())
+            end = start + np.array((1,) * (5 - len(tile.shape)) + tuple(tile.shape))
+            tcz_block, tcz_offset = np.divmod(start[:3], chunk_shape[:3])
+            if (
+                np.any(tcz_offset != 0)
+                or np.any(tcz_block < 0)
+                or np.any(tcz_block >= n_chunks[:3])
+            ):
+                continue
+
+            tcz_block = tuple(int(b) for b in tcz_block)
+            y_first, x_first = np.maximum(start[3:] // chunk_shape[3:], 0)
+            y_last, x_last = np.minimum(
+                (end[3:] - 1) // chunk_shape[3:], n_chunks[3:] - 1
             )
-            pos = (block_bbox.time_start, block_bbox.channel_start, block_bbox.z_start)
-            if pos in tiles_lut.keys():
-                for tile in tiles_lut[pos]:
-                    tile_bbox = BoundingBox5D.from_pos_and_shape(
-                        position=tile.get_position(),
-                        shape=(1,) * (5 - len(tile.shape)) + tile.shape,
-                    )
-                    if block_bbox.overlaps(tile_bbox):
-                        block_to_tile_map[block_position].append(tile)
+            for y in range(y_first, y_last + 1):
+                for x in range(x_first, x_last + 1):
+                    block_to_tile_map[tcz_block + (y, x)].append(tile)
 
         return block_to_tile_map
 
@@ -150,9 +146,10 @@ class DaskTileStitcher:
         """
         Stitch the tiles into a single image.
 
-        Note: This runs in 'synchronous' mode i.e. single threaded. If you
-        want to use multiple threads, use get_stitched_dask_array() and
-        compute the result using a configured dask scheduler.
+        Note: This computes the result with the currently configured dask
+        scheduler, by default the threaded scheduler which reuses one shared
+        thread pool across calls. If you want to use a different scheduler,
+        use get_stitched_dask_array() and compute the result yourself.
 
         Parameters
         ----------
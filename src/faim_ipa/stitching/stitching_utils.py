@@ -1,4 +1,5 @@
 from copy import copy
+from typing import Optional
 
 import numpy as np
 from numpy._typing import NDArray
@@ -26,25 +27,69 @@ def fuse_linear(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
     dtype = warped_tiles.dtype
     if warped_tiles.shape[0] > 1:
         warped_masks = warped_masks[:, 0]
-        weights = np.zeros_like(warped_masks, dtype=np.float32)
-        for i, mask in enumerate(warped_masks):
-            weights[i] = distance_transform_edt(
-                warped_masks[i].astype(np.float32),
-            )
-
-        denominator = weights.sum(axis=0)
-        weights = np.true_divide(weights, denominator, where=denominator > 0)
-        weights = np.nan_to_num(weights, nan=0, posinf=1, neginf=0)
-        weights = np.clip(
-            weights,
-            0,
-            1,
+        fused_image = np.zeros(
+            warped_tiles.shape[1:], dtype=np.result_type(dtype, np.float32)
         )
-        weights = weights[:, np.newaxis, ...]
-    else:
-        weights = warped_masks
+        denominator = np.zeros(warped_masks.shape[1:], dtype=np.float32)
+        for tile, mask in zip(warped_tiles, warped_masks):
+            weight = _get_linear_weights(mask)
+            fused_image += tile * weight
+            denominator += weight
+
+        np.true_divide(fused_image, denominator, out=fused_image, where=denominator > 0)
+        return fused_image.astype(dtype)
+
+    return np.sum(warped_tiles * warped_masks, axis=0).astype(dtype)
+
+
+def _get_linear_weights(mask: NDArray) -> NDArray:
+    """
+    Distance of every foreground pixel to the closest background pixel.
+
+    Warped tile masks are axis-aligned rectangles, for which the distance
+    separates into 1-D distances to the rectangle borders. Other masks fall
+    back to the euclidean distance transform.
+
+    Parameters
+    ----------
+    mask :
+        2D mask of a transformed tile.
+
+    Returns
+    -------
+    Weights as float32.
+    """
+    ny, nx = mask.shape
+    rows = np.flatnonzero(np.any(mask, axis=1))
+    cols = np.flatnonzero(np.any(mask, axis=0))
+    if len(rows) == 0:
+        return np.zeros(mask.shape, dtype=np.float32)
+
+    y0, y1 = rows[0], rows[-1] + 1
+    x0, x1 = cols[0], cols[-1] + 1
+    if (y0, y1, x0, x1) == (0, ny, 0, nx) or not mask[y0:y1, x0:x1].all():
+        return distance_transform_edt(mask).astype(np.float32)
+
+    weights = np.zeros(mask.shape, dtype=np.float32)
+    weights[y0:y1, x0:x1] = np.minimum(
+        _get_border_distance(y0, y1, ny)[:, np.newaxis],
+        _get_border_distance(x0, x1, nx)[np.newaxis, :],
+    )
+    return weights
+
 
-    return np.sum(warped_tiles * weights, axis=0).astype(dtype)
+def _get_border_distance(start: int, stop: int, size: int) -> NDArray:
+    """
+    1-D distance of the indices in [start, stop) to the closest index
+    outside of it, ignoring the borders of the image.
+    """
+    index = np.arange(start, stop)
+    distance = np.full(stop - start, np.inf, dtype=np.float32)
+    if start > 0:
+        np.minimum(distance, index - start + 1, out=distance)
+    if stop < size:
+        np.minimum(distance, stop - index, out=distance)
+    return distance
 
 
 def fuse_mean(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
@@ -62,18 +107,24 @@ def fuse_mean(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
     -------
     Fused image.
     """
+    dtype = warped_tiles.dtype
     warped_masks = warped_masks[:, 0]
-    denominator = warped_masks.sum(axis=0)
-    weights = np.true_divide(warped_masks, denominator, where=denominator > 0)
-    weights = np.clip(
-        np.nan_to_num(weights, nan=0, posinf=1, neginf=0),
-        0,
-        1,
+    # The count only has to hold the number of tiles, usually uint8.
+    count = np.add.reduce(
+        warped_masks, axis=0, dtype=np.min_scalar_type(len(warped_masks))
     )
-    weights = weights[:, np.newaxis, ...]
-
-    fused_image = np.sum(warped_tiles * weights, axis=0)
-    return fused_image.astype(warped_tiles.dtype)
+    fused_image = np.add.reduce(
+        warped_tiles,
+        axis=0,
+        dtype=_accumulator_dtype(dtype),
+        where=warped_masks[:, np.newaxis],
+    )
+    # Pixels without any tile have a sum of 0, dividing by 1 keeps them 0.
+    np.maximum(count, 1, out=count)
+    if np.issubdtype(dtype, np.unsignedinteger):
+        # Exact truncated mean, computed without a float64 copy.
+        return np.floor_divide(fused_image, count).astype(dtype)
+    return np.true_divide(fused_image, count).astype(dtype)
 
 
 def fuse_sum(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
@@ -91,8 +142,38 @@ def fuse_sum(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
     -------
     Fused image.
     """
-    fused_image = np.sum(warped_tiles, axis=0)
-    return fused_image.astype(warped_tiles.dtype)
+    if warped_tiles.dtype == bool:
+        # Acquisition masks: a single logical-or pass instead of an integer
+        # sum followed by a cast back to bool.
+        return np.logical_or.reduce(warped_tiles, axis=0)
+
+    dtype = warped_tiles.dtype
+    if np.issubdtype(dtype, np.integer):
+        # Saturate instead of wrapping around when casting back.
+        info = np.iinfo(dtype)
+        fused_image = np.add.reduce(
+            warped_tiles, axis=0, dtype=_accumulator_dtype(dtype)
+        )
+        np.clip(fused_image, info.min, info.max, out=fused_image)
+        return fused_image.astype(dtype)
+
+    return np.add.reduce(warped_tiles, axis=0).astype(dtype)
+
+
+def _accumulator_dtype(dtype: np.dtype) -> np.dtype:
+    """
+    Data type used to sum up tiles of the given dtype.
+
+    Integers are accumulated in 32 bit, or in 64 bit if they are at least
+    32 bit wide themselves. Everything else is accumulated in float64.
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        bits = 64 if dtype.itemsize >= 4 else 32
+        if np.issubdtype(dtype, np.unsignedinteger):
+            return np.dtype(f"uint{bits}")
+        return np.dtype(f"int{bits}")
+    return np.dtype(np.float64)
 
 
 def translate_tiles_2d(
@@ -118,55 +199,94 @@ def translate_tiles_2d(
     chunk_zyx_origin = np.array(
         [array_location[2][0], array_location[3][0], array_location[4][0]]
     )
-    warped_tiles = []
-    warped_masks = []
-    for tile in tiles:
-        tile_origin = np.array(tile.get_zyx_position())
+    tile_origins = np.array([tile.get_zyx_position() for tile in tiles])
+    stack_shape = (len(tiles),) + tuple(chunk_shape)
+    warped_masks = np.zeros(stack_shape, dtype=bool)
+    if len(tiles) == 0:
+        # Without tiles there is no data dtype, keep an empty stack.
+        dtype = bool if build_acquisition_mask else np.float64
+        return np.zeros(stack_shape, dtype=dtype), warped_masks
+
+    warped_tiles = None
+    shift = _make_shifter(chunk_zyx_origin, chunk_shape)
+    for i, (tile, tile_origin) in enumerate(zip(tiles, tile_origins)):
         if build_acquisition_mask:
             tile_data = tile.load_data_mask()
         else:
             tile_data = tile.load_data()
         if tile_data.ndim == 2:
             tile_data = tile_data[np.newaxis, ...]
-        warped_mask, warped_tile = shift_yx(
-            chunk_zyx_origin, tile_data, tile_origin, chunk_shape
+        if (
+            len(tiles) == 1
+            and tile_data.shape == stack_shape[1:]
+            and np.array_equal(tile_origin[1:], chunk_zyx_origin[1:])
+        ):
+            # A single tile covering exactly this chunk needs no shifting.
+            # Copy it, the result becomes a dask chunk and must not alias
+            # the tile loader's buffer.
+            return tile_data[np.newaxis].copy(), np.ones(stack_shape, dtype=bool)
+        if warped_tiles is None:
+            warped_tiles = np.zeros(stack_shape, dtype=tile_data.dtype)
+        shift(
+            tile_data,
+            tile_origin,
+            warped_tile=warped_tiles[i],
+            warped_mask=warped_masks[i],
         )
 
-        warped_tiles.append(warped_tile)
-        warped_masks.append(warped_mask)
+    return warped_tiles, warped_masks
+
 
-    return np.array(warped_tiles), np.array(warped_masks)
+def shift_yx(
+    chunk_zyx_origin,
+    tile_data,
+    tile_origin,
+    chunk_shape,
+    warped_tile=None,
+    warped_mask=None,
+):
+    shift = _make_shifter(chunk_zyx_origin, chunk_shape)
+    return shift(tile_data, tile_origin, warped_tile, warped_mask)
 
 
-def shift_yx(chunk_zyx_origin, tile_data, tile_origin, chunk_shape):
-    warped_tile = np.zeros(chunk_shape, dtype=tile_data.dtype)
-    warped_mask = np.zeros(chunk_shape, dtype=bool)
-    yx_shift = (tile_origin - chunk_zyx_origin)[1:]
-    if yx_shift[0] < 0:
-        tile_start_y = abs(yx_shift[0])
-        tile_end_y = min(tile_start_y + chunk_shape[1], tile_data.shape[1])
-    else:
-        tile_start_y = 0
-        tile_end_y = max(
-            0, min(tile_start_y + chunk_shape[1] - yx_shift[0], tile_data.shape[1])
+def _make_shifter(chunk_zyx_origin, chunk_shape):
+    """
+    Specialize shift_yx for a fixed chunk origin and shape.
+
+    Everything that only depends on the chunk is computed once, the returned
+    function only does the per-tile work.
+    """
+    chunk_shape = tuple(chunk_shape)
+    chunk_yx_origin = np.asarray(chunk_zyx_origin)[1:]
+    chunk_yx_shape = np.array(chunk_shape[1:])
+
+    def shift(tile_data, tile_origin, warped_tile=None, warped_mask=None):
+        if warped_tile is None:
+            warped_tile = np.zeros(chunk_shape, dtype=tile_data.dtype)
+        if warped_mask is None:
+            warped_mask = np.zeros(chunk_shape, dtype=bool)
+        yx_shift = np.asarray(tile_origin)[1:] - chunk_yx_origin
+        tile_start = np.maximum(-yx_shift, 0)
+        chunk_start = np.maximum(yx_shift, 0)
+        extent = np.clip(
+            np.minimum(
+                np.array(tile_data.shape[1:]) - tile_start,
+                chunk_yx_shape - chunk_start,
+            ),
+            0,
+            None,
         )
-    if yx_shift[1] < 0:
-        tile_start_x = abs(yx_shift[1])
-        tile_end_x = min(tile_start_x + chunk_shape[2], tile_data.shape[2])
-    else:
-        tile_start_x = 0
-        tile_end_x = min(
-            tile_start_x + chunk_shape[2] - yx_shift[1], tile_data.shape[2]
+        tile_slice = (slice(None),) + tuple(
+            slice(start, start + n) for start, n in zip(tile_start, extent)
+        )
+        chunk_slice = (slice(tile_data.shape[0]),) + tuple(
+            slice(start, start + n) for start, n in zip(chunk_start, extent)
         )
-    tile_data = tile_data[:, tile_start_y:tile_end_y, tile_start_x:tile_end_x]
-    if tile_data.size > 0:
-        start_y = max(0, yx_shift[0])
-        end_y = start_y + tile_data.shape[1]
-        start_x = max(0, yx_shift[1])
-        end_x = start_x + tile_data.shape[2]
-        warped_tile[: tile_data.shape[0], start_y:end_y, start_x:end_x] = tile_data
-        warped_mask[: tile_data.shape[0], start_y:end_y, start_x:end_x] = True
-    return warped_mask, warped_tile
+        warped_tile[chunk_slice] = tile_data[tile_slice]
+        warped_mask[chunk_slice] = True
+        return warped_mask, warped_tile
+
+    return shift
 
 
 def assemble_chunk(
@@ -199,25 +319,61 @@ def assemble_chunk(
     """
     chunk_location = block_info[None]["chunk-location"]
     chunk_shape = block_info[None]["chunk-shape"]
-    tiles = tile_map[chunk_location]
+    tiles = tile_map.get(chunk_location, ())
 
-    if len(tiles) > 0:
-        warped_tiles, warped_masks = warp_func(
-            block_info, chunk_shape[-3:], tiles, build_acquisition_mask
-        )
+    if len(tiles) == 0:
+        return np.zeros(chunk_shape, dtype=dtype)
 
-        if len(tiles) > 1:
+    warped_tiles, warped_masks = warp_func(
+        block_info, chunk_shape[-3:], tiles, build_acquisition_mask
+    )
+
+    if len(tiles) > 1:
+        window = _get_fuse_window(warped_masks)
+        if window is None:
             stitched_img = fuse_func(
                 warped_tiles,
                 warped_masks,
             )
-            stitched_img = stitched_img[np.newaxis, np.newaxis, ...]
         else:
-            stitched_img = warped_tiles[np.newaxis, ...]
+            # Tiles only cover part of this chunk, fuse the covered window.
+            stitched_img = np.zeros(warped_tiles.shape[1:], dtype=warped_tiles.dtype)
+            stitched_img[window] = fuse_func(
+                warped_tiles[(slice(None),) + window],
+                warped_masks[(slice(None),) + window],
+            )
+        return stitched_img[np.newaxis, np.newaxis, ...]
     else:
-        stitched_img = np.zeros(chunk_shape, dtype=dtype)
+        return warped_tiles[np.newaxis, ...]
+
+
+def _get_fuse_window(warped_masks: NDArray) -> Optional[tuple[slice, ...]]:
+    """
+    Compute the zyx-window of a chunk which is covered by any of the tiles.
+
+    The window is grown by one pixel in yx, such that distance based fuse
+    functions see the same background as in the full chunk.
+
+    Parameters
+    ----------
+    warped_masks :
+        Masks indicating foreground pixels for the transformed tiles.
 
-    return stitched_img
+    Returns
+    -------
+    Window slices or None if the window spans the whole chunk.
+    """
+    covered = np.any(warped_masks, axis=(0, 1))
+    rows = np.flatnonzero(np.any(covered, axis=1))
+    cols = np.flatnonzero(np.any(covered, axis=0))
+    if len(rows) == 0:
+        return None
+    ny, nx = covered.shape
+    y0, y1 = max(rows[0] - 1, 0), min(rows[-1] + 2, ny)
+    x0, x1 = max(cols[0] - 1, 0), min(cols[-1] + 2, nx)
+    if (y1 - y0, x1 - x0) == (ny, nx):
+        return None
+    return slice(None), slice(y0, y1), slice(x0, x1)
 
 
 def shift_to_origin(tiles: list[Tile]) -> list[Tile]:
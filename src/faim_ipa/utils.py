@@ -1,12 +1,14 @@
 import logging
 import pathlib
 from datetime import datetime
+from functools import lru_cache
 import os.path
 
 import pydantic
 from pydantic import BaseModel
 
 
+@lru_cache(maxsize=512)
 def wavelength_to_rgb(wavelength, gamma=0.8):
     """This converts a given wavelength of light to an
     approximate RGB color value. The wavelength must be given
@@ -16,6 +18,9 @@ def wavelength_to_rgb(wavelength, gamma=0.8):
     http://www.physics.sfasu.edu/astro/color/spectra.html
 
     Obtained from https://gist.github.com/error454/65d7f392e1acd4a782fc
+
+    Results are cached, a cache of 512 entries holds every integer
+    wavelength of the visible range.
     """
 
     wavelength = float(wavelength)
@@ -33,7 +33,7 @@ class RegionAcquisitionSTK(WellAcquisition):
             y_spacing = metadata["YCalibration"]
             self._yx_spacing = (y_spacing, x_spacing)
             self._z_spacing = metadata["ZDistance"].mean()
-            self.tile_shape = tif.asarray().shape
+            self.tile_shape = tif.series[0].shape
 
         self._axes = axes
         self._memmap = memmap
@@ -93,7 +93,7 @@ class RegionAcquisitionOME(WellAcquisition):
         self.stage_positions = self.metadata["stage_positions"]
         path = files.iloc[0]["path"]
         with TiffFile(path) as tif:
-            self.tile_shape = tif.asarray().shape
+            self.tile_shape = tif.series[0].shape
 
         self._axes = axes
         self._memmap = memmap
@@ -11,8 +11,15 @@ from faim_ipa.utils import rgb_to_hex, wavelength_to_rgb
 
 SCHEMA = "{http://www.openmicroscopy.org/Schemas/OME/2016-06}"
 
+_IMAGE = f"{SCHEMA}Image"
+_PIXELS = f"{SCHEMA}Pixels"
+_PLANE = f"{SCHEMA}Plane"
+_CHANNEL = f"{SCHEMA}Channel"
+_OBJECTIVE_SETTINGS = f"{SCHEMA}ObjectiveSettings"
+_STAGE_LABEL = f"{SCHEMA}StageLabel"
 
-def get_z_spacing(metadata: lxml.etree.ElementTree) -> Optional[float]:
+
+def get_z_spacing(metadata: lxml.etree._Element) -> Optional[float]:
     """
     Get the Z spacing from the first image in the XML metadata.
 
@@ -25,10 +32,10 @@ def get_z_spacing(metadata: lxml.etree.ElementTree) -> Optional[float]:
     -------
         Z spacing or None if there is only one Z plane
     """
-    image_0 = next(metadata.iterchildren(f"{SCHEMA}Image"))
-    pixels = next(image_0.iterchildren(f"{SCHEMA}Pixels"))
+    image_0 = next(metadata.iterchildren(_IMAGE))
+    pixels = next(image_0.iterchildren(_PIXELS))
     z_positions = set()
-    for plane in pixels.iterchildren(f"{SCHEMA}Plane"):
+    for plane in pixels.iterchildren(_PLANE):
         z_positions.add(float(plane.get("PositionZ")))
 
     if len(z_positions) == 1:
@@ -39,7 +46,7 @@ def get_z_spacing(metadata: lxml.etree.ElementTree) -> Optional[float]:
         return np.round(np.diff(z_positions).mean(), precision)
 
 
-def get_yx_spacing(metadata: lxml.etree.ElementTree) -> tuple[float, float]:
+def get_yx_spacing(metadata: lxml.etree._Element) -> tuple[float, float]:
     """
     Get the YX spacing from the first image in the XML metadata.
 
@@ -52,15 +59,15 @@ def get_yx_spacing(metadata: lxml.etree.ElementTree) -> tuple[float, float]:
     -------
         YX spacing
     """
-    image_0 = next(metadata.iterchildren(f"{SCHEMA}Image"))
-    pixels = next(image_0.iterchildren(f"{SCHEMA}Pixels"))
+    image_0 = next(metadata.iterchildren(_IMAGE))
+    pixels = next(image_0.iterchildren(_PIXELS))
     return (
         float(pixels.get("PhysicalSizeY")),
         float(pixels.get("PhysicalSizeX")),
     )
 
 
-def get_exposure_time(metadata: lxml.etree.ElementTree) -> tuple[float, str]:
+def get_exposure_time(metadata: lxml.etree._Element) -> tuple[float, str]:
     """
     Get the exposure time and unit from the first image in the XML metadata.
 
@@ -73,13 +80,13 @@ def get_exposure_time(metadata: lxml.etree.ElementTree) -> tuple[float, str]:
     -------
         Exposure time and unit
     """
-    image_0 = next(metadata.iterchildren(f"{SCHEMA}Image"))
-    pixels = next(image_0.iterchildren(f"{SCHEMA}Pixels"))
-    plane_0 = next(pixels.iterchildren(f"{SCHEMA}Plane"))
+    image_0 = next(metadata.iterchildren(_IMAGE))
+    pixels = next(image_0.iterchildren(_PIXELS))
+    plane_0 = next(pixels.iterchildren(_PLANE))
     return plane_0.get("ExposureTime"), plane_0.get("ExposureTimeUnit")
 
 
-def get_channels(metadata: lxml.etree.ElementTree) -> dict[str, ChannelMetadata]:
+def get_channels(metadata: lxml.etree._Element) -> dict[str, ChannelMetadata]:
     """
     Get the channel metadata from the XML metadata.
 
@@ -92,11 +99,12 @@ def get_channels(metadata: lxml.etree.ElementTree) -> dict[str, ChannelMetadata]
     -------
         Channel metadata for each channel.
     """
-    image_0 = next(metadata.iterchildren(f"{SCHEMA}Image"))
-    pixels = next(image_0.iterchildren(f"{SCHEMA}Pixels"))
-    channels = [channel.attrib for channel in pixels.iterchildren(f"{SCHEMA}Channel")]
-    objective = next(image_0.iterchildren(f"{SCHEMA}ObjectiveSettings")).get("ID")
+    image_0 = next(metadata.iterchildren(_IMAGE))
+    pixels = next(image_0.iterchildren(_PIXELS))
+    channels = [channel.attrib for channel in pixels.iterchildren(_CHANNEL)]
+    objective = next(image_0.iterchildren(_OBJECTIVE_SETTINGS)).get("ID")
     yx_spacing = get_yx_spacing(metadata)
+    z_spacing = get_z_spacing(metadata)
     exposure_time, exposure_time_unit = get_exposure_time(metadata)
 
     ch_metadata = {}
@@ -115,7 +123,7 @@ def get_channels(metadata: lxml.etree.ElementTree) -> dict[str, ChannelMetadata]
             spatial_calibration_x=yx_spacing[1],
             spatial_calibration_y=yx_spacing[0],
             spatial_calibration_units="um",
-            z_spacing=get_z_spacing(metadata),
+            z_spacing=z_spacing,
             wavelength=wavelength,
             exposure_time=exposure_time,
             exposure_time_unit=exposure_time_unit,
@@ -126,7 +134,7 @@ def get_channels(metadata: lxml.etree.ElementTree) -> dict[str, ChannelMetadata]
 
 
 def get_stage_positions(
-    metadata: lxml.etree.ElementTree,
+    metadata: lxml.etree._Element,
 ) -> dict[str, tuple[float, float]]:
     """
     Get the stage positions for each image from the XML metadata.
@@ -141,13 +149,13 @@ def get_stage_positions(
         Stage positions for each image.
     """
     positions = {}
-    for i, image in enumerate(metadata.iterchildren(f"{SCHEMA}Image")):
+    for i, image in enumerate(metadata.iterchildren(_IMAGE)):
         id = image.get("ID")
         index = int(id.split(":")[-1])
         assert index == i, f"Expected index {i} but got {index}"
 
         try:
-            stage_label = next(image.iterchildren(f"{SCHEMA}StageLabel")).attrib
+            stage_label = next(image.iterchildren(_STAGE_LABEL)).attrib
 
             y_pos = float(stage_label["Y"])
             x_pos = float(stage_label["X"])
@@ -182,12 +190,12 @@ def parse_basic_metadata(companion_file: Union[Path, str]) -> dict[str, Any]:
         - channels
         - stage_positions
     """
-    with open(companion_file, "rb") as f:
-        root = etree.parse(f).getroot()
-        metadata = dict(
-            z_spacing=get_z_spacing(root),
-            yx_spacing=get_yx_spacing(root),
-            channels=get_channels(root),
-            stage_positions=get_stage_positions(root),
-        )
-    return metadata
+    # Let libxml2 read the file itself instead of going through a Python
+    # file object.
+    root = etree.parse(str(companion_file)).getroot()
+    return dict(
+        z_spacing=get_z_spacing(root),
+        yx_spacing=get_yx_spacing(root),
+        channels=get_channels(root),
+        stage_positions=get_stage_positions(root),
+    )
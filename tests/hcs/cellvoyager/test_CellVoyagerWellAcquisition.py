@@ -12,7 +12,7 @@ from faim_ipa.hcs.cellvoyager.CellVoyagerWellAcquisition import (
 from faim_ipa.hcs.cellvoyager.StackedTile import StackedTile
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def files() -> pd.DataFrame:
     resource_dir = Path(__file__).parent.parent.parent.parent
 
@@ -23,7 +23,7 @@ def files() -> pd.DataFrame:
     return files
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def metadata() -> pd.DataFrame:
     return pd.DataFrame(
         {
@@ -43,18 +43,22 @@ def test__assemble_tiles(files, metadata):
         metadata=metadata,
     )
 
+    y_positions = set(-(files["Y"].unique() / 0.65).astype(int))
+    x_positions = set((files["X"].unique() / 0.65).astype(int))
+    acquisition_dir = os.path.dirname(files["path"].iloc[0])
+    acquisition_files = {join(acquisition_dir, f) for f in os.listdir(acquisition_dir)}
     tiles = cv_well_acquisition._assemble_tiles()
     assert len(tiles) == 32
     for tile in tiles:
         assert isinstance(tile, StackedTile)
-        assert os.path.exists(tile._paths[0])
+        assert tile._paths[0] in acquisition_files
         assert len(tile._paths) == 1
         assert tile.shape == (1, 2000, 2000)
         assert tile.position.channel in [1, 2]
         assert tile.position.time == 1
         assert tile.position.z in [1, 2, 3, 4]
-        assert tile.position.y in list(-(files["Y"].unique() / 0.65).astype(int))
-        assert tile.position.x in list((files["X"].unique() / 0.65).astype(int))
+        assert tile.position.y in y_positions
+        assert tile.position.x in x_positions
 
 
 def test__assemble_tiles_missing_acquisition(files, metadata):
@@ -65,20 +69,24 @@ def test__assemble_tiles_missing_acquisition(files, metadata):
         n_planes_in_stacked_tile=2,
     )
 
+    y_positions = set(-(files["Y"].unique() / 0.65).astype(int))
+    x_positions = set((files["X"].unique() / 0.65).astype(int))
+    acquisition_dir = os.path.dirname(files["path"].iloc[0])
+    acquisition_files = {join(acquisition_dir, f) for f in os.listdir(acquisition_dir)}
     tiles = cv_well_acquisition._assemble_tiles()
     assert len(tiles) == 16
     for tile in tiles:
         assert isinstance(tile, StackedTile)
         assert len(tile._paths) == 2
-        assert os.path.exists(tile._paths[0])
+        assert tile._paths[0] in acquisition_files
         if tile._paths[1]:
-            assert os.path.exists(tile._paths[1])
+            assert tile._paths[1] in acquisition_files
         assert tile.shape == (2, 2000, 2000)
         assert tile.position.channel in [1, 2]
         assert tile.position.time == 1
         assert tile.position.z in [1, 3]
-        assert tile.position.y in list(-(files["Y"].unique() / 0.65).astype(int))
-        assert tile.position.x in list((files["X"].unique() / 0.65).astype(int))
+        assert tile.position.y in y_positions
+        assert tile.position.x in x_positions
         assert tile.load_data().shape == tile.shape
 
 
@@ -9,7 +9,7 @@ from faim_ipa.hcs.cellvoyager import StackAcquisition
 from faim_ipa.hcs.cellvoyager.StackedTile import StackedTile
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cv_acquisition() -> Path:
     dir = (
         Path(__file__).parent.parent.parent.parent
@@ -21,12 +21,15 @@ def cv_acquisition() -> Path:
     return dir
 
 
-def test_get_channel_metadata(cv_acquisition):
-    plate = StackAcquisition(
+@pytest.fixture(scope="module")
+def plate(cv_acquisition) -> StackAcquisition:
+    return StackAcquisition(
         acquisition_dir=cv_acquisition,
         alignment=TileAlignmentOptions.GRID,
     )
 
+
+def test_get_channel_metadata(plate):
     ch_metadata = plate.get_channel_metadata()
     assert len(ch_metadata) == 4
     assert ch_metadata[0].channel_name == "1"
@@ -74,12 +77,7 @@ def test_get_channel_metadata(cv_acquisition):
     assert ch_metadata[3].objective == "20x v2"
 
 
-def test__parse_files(cv_acquisition):
-    plate = StackAcquisition(
-        acquisition_dir=cv_acquisition,
-        alignment=TileAlignmentOptions.GRID,
-    )
-
+def test__parse_files(plate):
     files = plate._parse_files()
     assert len(files) == 96
     assert files["well"].unique().tolist() == ["D08", "E03", "F08"]
@@ -103,12 +101,7 @@ def test__parse_files(cv_acquisition):
     ]
 
 
-def test_get_well_acquisitions(cv_acquisition):
-    plate = StackAcquisition(
-        acquisition_dir=cv_acquisition,
-        alignment=TileAlignmentOptions.GRID,
-    )
-
+def test_get_well_acquisitions(plate):
     wells = plate.get_well_acquisitions()
     assert len(wells) == 3
     for well in wells:
@@ -8,7 +8,7 @@ from faim_ipa.hcs.acquisition import TileAlignmentOptions
 from faim_ipa.hcs.cellvoyager import ZAdjustedStackAcquisition
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cv_acquisition() -> Path:
     dir = (
         Path(__file__).parent.parent.parent.parent
@@ -20,7 +20,7 @@ def cv_acquisition() -> Path:
     return dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trace_log_file() -> Path:
     return (
         Path(__file__).parent.parent.parent.parent
@@ -31,7 +31,7 @@ def trace_log_file() -> Path:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def incomplete_trace_log_file() -> Path:
     return (
         Path(__file__).parent.parent.parent.parent
@@ -42,14 +42,17 @@ def incomplete_trace_log_file() -> Path:
     )
 
 
-def test__parse_files(cv_acquisition, trace_log_file):
+@pytest.fixture(scope="module")
+def plate(cv_acquisition, trace_log_file) -> ZAdjustedStackAcquisition:
     with pytest.warns(UserWarning, match="First file without z position"):
-        plate = ZAdjustedStackAcquisition(
+        return ZAdjustedStackAcquisition(
             acquisition_dir=cv_acquisition,
             trace_log_files=[trace_log_file],
             alignment=TileAlignmentOptions.GRID,
         )
 
+
+def test__parse_files(plate):
     files = plate._parse_files()
     assert len(files) == 96
     assert files["well"].unique().tolist() == ["D08", "E03", "F08"]
@@ -86,14 +89,7 @@ def test__parse_files(cv_acquisition, trace_log_file):
     ]
 
 
-def test_get_well_acquisitions(cv_acquisition, trace_log_file):
-    with pytest.warns(UserWarning, match="First file without z position"):
-        plate = ZAdjustedStackAcquisition(
-            acquisition_dir=cv_acquisition,
-            trace_log_files=[trace_log_file],
-            alignment=TileAlignmentOptions.GRID,
-        )
-
+def test_get_well_acquisitions(plate):
     wells = plate.get_well_acquisitions()
     assert len(wells) == 3
     for well in wells:
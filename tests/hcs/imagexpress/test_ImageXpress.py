@@ -17,7 +17,7 @@ from faim_ipa.hcs.imagexpress import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def acquisition_dir():
     return (
         Path(__file__).parent.parent.parent.parent
@@ -27,7 +27,7 @@ def acquisition_dir():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def single_plane_acquisition(acquisition_dir):
     return SinglePlaneAcquisition(acquisition_dir, alignment=TileAlignmentOptions.GRID)
 
@@ -94,7 +94,7 @@ def test_single_plane_acquisition(single_plane_acquisition: PlateAcquisition):
             assert tile.shape == (512, 512)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stack_acquisition(acquisition_dir):
     return StackAcquisition(acquisition_dir, alignment=TileAlignmentOptions.GRID)
 
@@ -165,7 +165,7 @@ def test_stack_acquisition(stack_acquisition: PlateAcquisition):
             assert tile.shape == (512, 512)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mixed_acquisition(acquisition_dir):
     return imagexpress.MixedAcquisition(
         acquisition_dir,
@@ -273,7 +273,7 @@ def test_raise_not_implemented_error(dummy_plate):
         dummy_plate._get_z_spacing()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def acquisition_dir_single_channel():
     return (
         Path(__file__).parent.parent.parent.parent
@@ -283,7 +283,7 @@ def acquisition_dir_single_channel():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def single_channel_acquisition(acquisition_dir_single_channel):
     return SinglePlaneAcquisition(
         acquisition_dir_single_channel, alignment=TileAlignmentOptions.GRID
@@ -326,7 +326,7 @@ def test_single_channel_acquisition(single_channel_acquisition: PlateAcquisition
             assert tile.shape == (512, 512)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def acquisition_dir_time_lapse():
     return (
         Path(__file__).parent.parent.parent.parent
@@ -336,7 +336,7 @@ def acquisition_dir_time_lapse():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def time_lapse_acquisition(acquisition_dir_time_lapse):
     return SinglePlaneAcquisition(
         acquisition_dir_time_lapse, alignment=TileAlignmentOptions.STAGE_POSITION
@@ -1,3 +1,4 @@
+from os import listdir
 from os.path import exists, join
 from pathlib import Path
 
@@ -53,7 +54,7 @@ def hcs_plate(tmp_dir):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plate_acquisition():
     return StackAcquisition(
         acquisition_dir=Path(__file__).parent.parent.parent
@@ -65,7 +66,7 @@ def plate_acquisition():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plate_acquisition_2d():
     acq = StackAcquisition(
         acquisition_dir=Path(__file__).parent.parent.parent
@@ -103,7 +104,8 @@ def test__create_zarr_plate(tmp_dir, plate_acquisition, hcs_plate):
     converter = ConvertToNGFFPlate(hcs_plate)
     zarr_plate = converter.create_zarr_plate(plate_acquisition, wells=None)
 
-    assert exists(join(tmp_dir, "plate_name.zarr"))
+    plate_dir = join(tmp_dir, "plate_name.zarr")
+    assert exists(plate_dir)
     assert zarr_plate.attrs["plate"]["name"] == "plate_name"
     assert zarr_plate.attrs["order_name"] == "order_name"
     assert zarr_plate.attrs["barcode"] == "barcode"
@@ -113,11 +115,9 @@ def test__create_zarr_plate(tmp_dir, plate_acquisition, hcs_plate):
         {"columnIndex": 2, "path": "E/03", "rowIndex": 4},
         {"columnIndex": 7, "path": "F/08", "rowIndex": 5},
     ]
-    assert exists(join(tmp_dir, "plate_name.zarr", ".zgroup"))
-    assert exists(join(tmp_dir, "plate_name.zarr", ".zattrs"))
-    assert not exists(join(tmp_dir, "plate_name.zarr", "D"))
-    assert not exists(join(tmp_dir, "plate_name.zarr", "E"))
-    assert not exists(join(tmp_dir, "plate_name.zarr", "F"))
+    plate_contents = set(listdir(plate_dir))
+    assert {".zgroup", ".zattrs"} <= plate_contents
+    assert not {"D", "E", "F"} & plate_contents
 
     zarr_plate_1 = converter.create_zarr_plate(plate_acquisition)
     assert zarr_plate_1 == zarr_plate
@@ -178,7 +178,8 @@ def test__create_well_group(tmp_dir, plate_acquisition, hcs_plate):
         well_acquisition=plate_acquisition.get_well_acquisitions()[0],
         well_sub_group="0",
     )
-    assert exists(join(tmp_dir, "plate_name.zarr", "D", "08", "0"))
+    well_dir = join(tmp_dir, "plate_name.zarr", "D", "08", "0")
+    assert exists(well_dir)
     assert isinstance(well_group, zarr.Group)
 
     mask_group = converter._create_well_group(
@@ -187,7 +188,7 @@ def test__create_well_group(tmp_dir, plate_acquisition, hcs_plate):
         well_sub_group="0/mask",
         add_to_well_images=False,
     )
-    assert exists(join(tmp_dir, "plate_name.zarr", "D", "08", "0", "mask"))
+    assert exists(join(well_dir, "mask"))
     assert isinstance(mask_group, zarr.Group)
 
     assert mask_group.attrs.asdict()["well"]["images"] == [{"path": "0"}]
@@ -198,7 +199,7 @@ def test__create_well_group(tmp_dir, plate_acquisition, hcs_plate):
         well_sub_group="0/another",
         add_to_well_images=True,
     )
-    assert exists(join(tmp_dir, "plate_name.zarr", "D", "08", "0", "another"))
+    assert exists(join(well_dir, "another"))
     assert isinstance(another_group, zarr.Group)
     assert another_group.attrs.asdict()["well"]["images"] == [
         {"path": "0"},
@@ -321,16 +322,14 @@ def test_run(tmp_dir, plate_acquisition, hcs_plate):
         path = join(tmp_dir, "plate_name.zarr", row, col, "0")
         assert exists(path)
 
-        assert exists(join(path, "0"))
-        assert exists(join(path, "1"))
-        assert exists(join(path, ".zattrs"))
-        assert exists(join(path, ".zgroup"))
+        assert {"0", "1", ".zattrs", ".zgroup"} <= set(listdir(path))
 
-        assert "acquisition_metadata" in plate[row][col]["0"].attrs.keys()
-        assert "multiscales" in plate[row][col]["0"].attrs.keys()
-        assert "omero" in plate[row][col]["0"].attrs.keys()
+        attrs = plate[row][col]["0"].attrs.asdict()
+        assert "acquisition_metadata" in attrs.keys()
+        assert "multiscales" in attrs.keys()
+        assert "omero" in attrs.keys()
 
-        axes = plate[row][col]["0"].attrs["multiscales"][0]["axes"]
+        axes = attrs["multiscales"][0]["axes"]
         for axis in axes:
             if axis["type"] == "space":
                 assert "unit" in axis.keys()
@@ -369,14 +368,12 @@ def test_run_selection(tmp_dir, plate_acquisition, hcs_plate):
         path = join(tmp_dir, "plate_name.zarr", row, col, "0")
         assert exists(path)
 
-        assert exists(join(path, "0"))
-        assert exists(join(path, "1"))
-        assert exists(join(path, ".zattrs"))
-        assert exists(join(path, ".zgroup"))
+        assert {"0", "1", ".zattrs", ".zgroup"} <= set(listdir(path))
 
-        assert "acquisition_metadata" in plate[row][col]["0"].attrs.keys()
-        assert "multiscales" in plate[row][col]["0"].attrs.keys()
-        assert "omero" in plate[row][col]["0"].attrs.keys()
+        attrs = plate[row][col]["0"].attrs.asdict()
+        assert "acquisition_metadata" in attrs.keys()
+        assert "multiscales" in attrs.keys()
+        assert "omero" in attrs.keys()
 
         assert exists(join(path, "0", ".zarray"))
         assert exists(join(path, "1", ".zarray"))
@@ -385,6 +382,48 @@ def test_run_selection(tmp_dir, plate_acquisition, hcs_plate):
         assert plate[row][col]["0"]["1"].shape == (2, 4, 1000, 1000)
 
 
+def test_run_parallel_wells(tmp_path_factory, plate_acquisition):
+    plates = []
+    for max_parallel_wells in [1, 3]:
+        converter = ConvertToNGFFPlate(
+            NGFFPlate(
+                root_dir=tmp_path_factory.mktemp("hcs_plate"),
+                name="plate_name",
+                layout=PlateLayout.I96,
+                order_name="order_name",
+                barcode="barcode",
+            ),
+            yx_binning=2,
+            client=LocalCluster(
+                n_workers=1, threads_per_worker=4, processes=False
+            ).get_client(),
+        )
+        plate = converter.create_zarr_plate(plate_acquisition)
+        plates.append(
+            converter.run(
+                plate=plate,
+                plate_acquisition=plate_acquisition,
+                max_layer=2,
+                chunks=(1, 2000, 2000),
+                max_parallel_wells=max_parallel_wells,
+            )
+        )
+
+    serial, parallel = plates
+    assert parallel.attrs.asdict() == serial.attrs.asdict()
+    for well in ["D08", "E03", "F08"]:
+        row, col = well[0], well[1:]
+        assert parallel[row][col].attrs.asdict() == serial[row][col].attrs.asdict()
+        assert (
+            parallel[row][col]["0"].attrs.asdict()
+            == serial[row][col]["0"].attrs.asdict()
+        )
+        for level in ["0", "1"]:
+            np.testing.assert_array_equal(
+                parallel[row][col]["0"][level][:], serial[row][col]["0"][level][:]
+            )
+
+
 def test_provide_client(tmp_dir, plate_acquisition, hcs_plate):
     converter = ConvertToNGFFPlate(
         hcs_plate,
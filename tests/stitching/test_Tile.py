@@ -105,6 +105,7 @@ def test_Tile_data_mask():
     assert mask.dtype == bool
     assert mask.shape == (10, 10)
     assert mask.all()
+    assert mask.flags.writeable
 
 
 def test_CVStackedTile_data_mask():
@@ -124,6 +125,24 @@ def test_CVStackedTile_data_mask():
     assert mask[2].all()
 
 
+def test_CVStackedTile_load_data(test_img, bgcm):
+    from faim_ipa.hcs.cellvoyager.StackedTile import StackedTile
+
+    tile = StackedTile(
+        paths=[test_img[0], None, test_img[0]],
+        shape=(3, 10, 10),
+        dtype=np.uint8,
+        position=TilePosition(time=0, channel=0, z=0, y=0, x=0),
+        background_correction_matrix_path=bgcm[0],
+    )
+    data = tile.load_data()
+    assert data.dtype == np.uint8
+    assert data.shape == (3, 10, 10)
+    assert_array_equal(data[0], test_img[1] - bgcm[1])
+    assert_array_equal(data[1], 0)
+    assert_array_equal(data[2], test_img[1] - bgcm[1])
+
+
 def test_VisiViewStackedTile_data_mask():
     from faim_ipa.visiview.StackedTile import StackedTile
 
@@ -136,3 +155,4 @@ def test_VisiViewStackedTile_data_mask():
     assert mask.dtype == bool
     assert mask.shape == (3, 10, 10)
     assert mask.all()
+    assert mask.flags.writeable
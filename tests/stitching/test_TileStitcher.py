@@ -35,7 +35,7 @@ def tiles():
         tile.i = i
 
         def loader(self=tile):
-            return np.ones(self.shape) * self.i
+            return np.broadcast_to(np.float64(self.i), self.shape)
 
         tile.load_data = loader
     return tiles
@@ -146,10 +146,9 @@ def test_stitch_exact(tiles):
     )
     assert stitched.shape == (1, 1, 1, 20, 20)
 
-    assert_array_equal(stitched[..., :10, :10], np.ones((1, 1, 1, 10, 10)) * 0)
-    assert_array_equal(stitched[..., :10, 10:20], np.ones((1, 1, 1, 10, 10)) * 1)
-    assert_array_equal(stitched[..., 10:20, :10], np.ones((1, 1, 1, 10, 10)) * 2)
-    assert_array_equal(stitched[..., 10:20, 10:20], np.ones((1, 1, 1, 10, 10)) * 3)
+    # Tile i fills the i-th 10x10 quadrant with value i.
+    expected = np.repeat(np.repeat([[0, 1], [2, 3]], 10, axis=0), 10, axis=1)
+    assert_array_equal(stitched[0, 0, 0], expected)
 
 
 @pytest.fixture
@@ -180,7 +179,7 @@ def overlapping_tiles():
         tile.i = i
 
         def loader(self=tile):
-            return np.ones(self.shape) * self.i
+            return np.broadcast_to(np.float64(self.i), self.shape)
 
         tile.load_data = loader
 
@@ -194,13 +193,11 @@ def test_stitch_overlapping(overlapping_tiles):
         fuse_func=stitching_utils.fuse_sum,
     )
     assert stitched.shape == (1, 1, 1, 15, 15)
-    assert_array_equal(stitched[..., :5, :5], np.ones((1, 1, 1, 5, 5)) * 0)
-    assert_array_equal(stitched[..., :5, 5:15], np.ones((1, 1, 1, 5, 10)) * 1)
-    assert_array_equal(stitched[..., 5:15, :5], np.ones((1, 1, 1, 10, 5)) * 2)
-    assert_array_equal(stitched[..., 5:10, 5:10], np.ones((1, 1, 1, 5, 5)) * 6)
-    assert_array_equal(stitched[..., 10:15, 5:10], np.ones((1, 1, 1, 5, 5)) * 5)
-    assert_array_equal(stitched[..., 5:10, 10:15], np.ones((1, 1, 1, 5, 5)) * 4)
-    assert_array_equal(stitched[..., 10:15, 10:15], np.ones((1, 1, 1, 5, 5)) * 3)
+    # Sum of the tile values 0, 1, 2, 3 covering each 5x5 block.
+    expected = np.repeat(
+        np.repeat([[0, 1, 1], [2, 6, 4], [2, 5, 3]], 5, axis=0), 5, axis=1
+    )
+    assert_array_equal(stitched[0, 0, 0], expected)
 
 
 def test_stitch_overlapping_mask(overlapping_tiles):
@@ -211,12 +208,5 @@ def test_stitch_overlapping_mask(overlapping_tiles):
         build_acquisition_mask=True,
     )
     assert stitched.shape == (1, 1, 1, 15, 15)
-    assert_array_equal(stitched[..., :5, :5], np.ones((1, 1, 1, 5, 5), dtype=bool))
-    assert_array_equal(stitched[..., :5, 5:15], np.ones((1, 1, 1, 5, 10), dtype=bool))
-    assert_array_equal(stitched[..., 5:15, :5], np.ones((1, 1, 1, 10, 5), dtype=bool))
-    assert_array_equal(stitched[..., 5:10, 5:10], np.ones((1, 1, 1, 5, 5), dtype=bool))
-    assert_array_equal(stitched[..., 10:15, 5:10], np.ones((1, 1, 1, 5, 5), dtype=bool))
-    assert_array_equal(stitched[..., 5:10, 10:15], np.ones((1, 1, 1, 5, 5), dtype=bool))
-    assert_array_equal(
-        stitched[..., 10:15, 10:15], np.ones((1, 1, 1, 5, 5), dtype=bool)
-    )
+    assert stitched.dtype == bool
+    assert stitched.all()
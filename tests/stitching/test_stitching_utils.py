@@ -3,9 +3,11 @@ from dataclasses import dataclass
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
+from scipy.ndimage import distance_transform_edt
 
 from faim_ipa.stitching import Tile
 from faim_ipa.stitching.stitching_utils import (
+    _get_linear_weights,
     assemble_chunk,
     fuse_linear,
     fuse_mean,
@@ -16,66 +18,128 @@ from faim_ipa.stitching.stitching_utils import (
 )
 from faim_ipa.stitching.Tile import TilePosition
 
+# Linear blend of tile values 1 and 4 across the 10 overlapping columns.
+LINEAR_OVERLAP = ((1 * np.arange(10, 0, -1) + 4 * np.arange(1, 11)) // 11).astype(
+    np.uint16
+)
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tiles():
-    t1 = np.zeros((1, 10, 20), dtype=np.uint16)
-    t1[:, :, :15] = 1
-    t2 = np.zeros((1, 10, 20), dtype=np.uint16)
-    t2[:, :, 5:] = 4
-    return np.array([t1, t2])
+    tiles = np.zeros((2, 1, 10, 20), dtype=np.uint16)
+    tiles[0, :, :, :15] = 1
+    tiles[1, :, :, 5:] = 4
+    tiles.setflags(write=False)
+    return tiles
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def masks():
-    t1 = np.zeros((1, 10, 20), dtype=bool)
-    t1[:, :, :15] = True
-    t2 = np.zeros((1, 10, 20), dtype=bool)
-    t2[:, :, 5:] = True
-    return np.array([t1, t2])
-
-
-def test_fuse_mean(tiles, masks):
-    fused_result = fuse_mean(warped_tiles=tiles, warped_masks=masks)
+    masks = np.zeros((2, 1, 10, 20), dtype=bool)
+    masks[0, :, :, :15] = True
+    masks[1, :, :, 5:] = True
+    masks.setflags(write=False)
+    return masks
+
+
+@pytest.mark.parametrize(
+    "fuse_func,expected_overlap",
+    [
+        (fuse_mean, 2),
+        (fuse_sum, 5),
+        (fuse_linear, LINEAR_OVERLAP),
+    ],
+)
+def test_fuse(tiles, masks, fuse_func, expected_overlap):
+    fused_result = fuse_func(warped_tiles=tiles, warped_masks=masks)
     assert fused_result.shape == (1, 10, 20)
     assert fused_result.dtype == np.uint16
     assert_array_equal(fused_result[:, :, :5], 1)
-    assert_array_equal(fused_result[:, :, 5:15], 2)
+    assert_array_equal(
+        fused_result[:, :, 5:15], np.broadcast_to(expected_overlap, (1, 10, 10))
+    )
     assert_array_equal(fused_result[:, :, 15:], 4)
 
 
-def test_fuse_sum(tiles, masks):
-    fused_result = fuse_sum(warped_tiles=tiles, warped_masks=masks)
-    assert fused_result.shape == (1, 10, 20)
-    assert fused_result.dtype == np.uint16
-    assert_array_equal(fused_result[:, :, :5], 1)
-    assert_array_equal(fused_result[:, :, 5:15], 5)
-    assert_array_equal(fused_result[:, :, 15:], 4)
+@pytest.mark.parametrize("dtype", [np.uint32, np.int32])
+def test_fuse_mean_near_max(dtype):
+    value = np.iinfo(dtype).max - 5
+    tiles = np.full((2, 1, 3, 3), value, dtype=dtype)
+    fused_result = fuse_mean(warped_tiles=tiles, warped_masks=tiles > 0)
+    assert fused_result.dtype == dtype
+    assert_array_equal(fused_result, value)
+
 
+def test_fuse_mean_truncates_exact_mean():
+    rng = np.random.default_rng(0)
+    max_value = np.iinfo(np.uint32).max
+    tiles = rng.integers(max_value - 1000, max_value, (3, 1, 8, 8), dtype=np.uint32)
+    masks = rng.random((3, 1, 8, 8)) > 0.3
+    fused_result = fuse_mean(warped_tiles=tiles, warped_masks=masks)
 
-def test_fuse_linear(tiles, masks):
-    fused_result = fuse_linear(warped_tiles=tiles, warped_masks=masks)
+    # Exact reference with python integers.
+    expected = np.zeros((1, 8, 8), dtype=np.uint32)
+    for index in np.ndindex(expected.shape):
+        values = [int(t[index]) for t, m in zip(tiles, masks) if m[index]]
+        expected[index] = sum(values) // max(len(values), 1)
+    assert_array_equal(fused_result, expected)
+
+
+def test_fuse_sum_mask(masks):
+    fused_result = fuse_sum(warped_tiles=masks, warped_masks=masks)
     assert fused_result.shape == (1, 10, 20)
-    assert fused_result.dtype == np.uint16
-    assert_array_equal(fused_result[:, :, :5], 1)
-    assert_array_equal(fused_result[:, :, 5], int(1 * 10 / 11 + 4 * 1 / 11))
-    assert_array_equal(fused_result[:, :, 6], int(1 * 9 / 11 + 4 * 2 / 11))
-    assert_array_equal(fused_result[:, :, 7], int(1 * 8 / 11 + 4 * 3 / 11))
-    assert_array_equal(fused_result[:, :, 8], int(1 * 7 / 11 + 4 * 4 / 11))
-    assert_array_equal(fused_result[:, :, 9], int(1 * 6 / 11 + 4 * 5 / 11))
-    assert_array_equal(fused_result[:, :, 10], int(1 * 5 / 11 + 4 * 6 / 11))
-    assert_array_equal(fused_result[:, :, 11], int(1 * 4 / 11 + 4 * 7 / 11))
-    assert_array_equal(fused_result[:, :, 12], int(1 * 3 / 11 + 4 * 8 / 11))
-    assert_array_equal(fused_result[:, :, 13], int(1 * 2 / 11 + 4 * 9 / 11))
-    assert_array_equal(fused_result[:, :, 14], int(1 * 1 / 11 + 4 * 10 / 11))
-    assert_array_equal(fused_result[:, :, 15:], 4)
+    assert fused_result.dtype == bool
+    assert_array_equal(fused_result, True)
+
+
+@pytest.mark.parametrize(
+    "dtype,value,expected",
+    [
+        (np.uint16, 40000, np.iinfo(np.uint16).max),
+        (np.uint32, np.iinfo(np.uint32).max - 5, np.iinfo(np.uint32).max),
+        (np.int32, np.iinfo(np.int32).max - 5, np.iinfo(np.int32).max),
+        (np.int32, np.iinfo(np.int32).min + 5, np.iinfo(np.int32).min),
+    ],
+)
+def test_fuse_sum_saturates(dtype, value, expected):
+    tiles = np.full((2, 1, 3, 3), value, dtype=dtype)
+    masks = np.ones(tiles.shape, dtype=bool)
+    fused_result = fuse_sum(warped_tiles=tiles, warped_masks=masks)
+    assert fused_result.dtype == dtype
+    assert_array_equal(fused_result, expected)
 
+
+def test_fuse_linear_single_tile(tiles, masks):
     fused_result = fuse_linear(warped_tiles=tiles[:1], warped_masks=masks[:1])
     assert fused_result.shape == (1, 10, 20)
     assert fused_result.dtype == np.uint16
     assert_array_equal(fused_result, tiles[0])
 
 
+@pytest.mark.parametrize(
+    "region",
+    [
+        np.s_[2:6, 3:9],
+        np.s_[:6, 3:],
+        np.s_[:, 3:9],
+        np.s_[:, :],
+        np.s_[0:0, :],
+    ],
+)
+def test_get_linear_weights(region):
+    mask = np.zeros((8, 12), dtype=bool)
+    mask[region] = True
+    weights = _get_linear_weights(mask)
+    assert weights.dtype == np.float32
+    assert_array_equal(weights, distance_transform_edt(mask).astype(np.float32))
+
+    # Non-rectangular masks fall back to the distance transform.
+    mask[4, 5] = not mask[4, 5]
+    assert_array_equal(
+        _get_linear_weights(mask), distance_transform_edt(mask).astype(np.float32)
+    )
+
+
 @dataclass
 class DummyTile:
     def __init__(self, yx_position, data):
@@ -142,6 +206,18 @@ def test_assemble_chunk(tiles):
     assert stitched_img.shape == (1, 1, 1, 10, 20)
     assert_array_equal(stitched_img[0, 0], np.zeros_like(tiles[0], dtype=np.uint16))
 
+    block_info[None]["chunk-location"] = (2, 0, 0, 0, 0)
+    stitched_img = assemble_chunk(
+        block_info=block_info,
+        tile_map=tile_map,
+        warp_func=translate_tiles_2d,
+        fuse_func=fuse_mean,
+        dtype=np.uint16,
+    )
+    assert stitched_img.shape == (1, 1, 1, 10, 20)
+    assert stitched_img.dtype == np.uint16
+    assert_array_equal(stitched_img[0, 0], np.zeros_like(tiles[0], dtype=np.uint16))
+
     tile_map = {
         (0, 0, 0, 0, 0): [
             DummyTile(yx_position=(0, 0), data=tiles[0][..., :15]),
@@ -171,6 +247,38 @@ def test_assemble_chunk(tiles):
     assert_array_equal(stitched_img[0, 0], tiles[0])
 
 
+@pytest.mark.parametrize("fuse_func", [fuse_mean, fuse_sum, fuse_linear])
+def test_assemble_chunk_partially_covered(tiles, fuse_func):
+    # Both tiles only cover the top left part of a larger chunk.
+    tile_map = {
+        (0, 0, 0, 0, 0): [
+            DummyTile(yx_position=(2, 3), data=tiles[0][..., :15]),
+            DummyTile(yx_position=(2, 8), data=tiles[1][..., 5:]),
+        ],
+    }
+    block_info = {
+        None: {
+            "array-location": [(0, 1), (0, 1), (0, 1), (0, 16), (0, 30)],
+            "chunk-location": (0, 0, 0, 0, 0),
+            "chunk-shape": (1, 1, 1, 16, 30),
+        }
+    }
+
+    stitched_img = assemble_chunk(
+        block_info=block_info,
+        tile_map=tile_map,
+        warp_func=translate_tiles_2d,
+        fuse_func=fuse_func,
+        dtype=np.uint16,
+    )
+
+    warped_tiles, warped_masks = translate_tiles_2d(
+        block_info, (1, 16, 30), tile_map[(0, 0, 0, 0, 0)]
+    )
+    assert stitched_img.shape == (1, 1, 1, 16, 30)
+    assert_array_equal(stitched_img[0, 0], fuse_func(warped_tiles, warped_masks))
+
+
 def test_shift_to_origin():
     result = shift_to_origin(
         [
@@ -185,11 +293,21 @@ def test_shift_to_origin():
     assert result[0].get_position() == (0, 0, 0, 0, 0)
 
 
-def test_translate_3d_tiles_2d(tiles):
+@pytest.mark.parametrize(
+    "tile_ndim,build_acquisition_mask",
+    [
+        (3, False),
+        (2, False),
+        (2, True),
+    ],
+)
+def test_translate_tiles_2d(tiles, tile_ndim, build_acquisition_mask):
+    # 2D tiles drop the leading z axis
+    z = slice(None) if tile_ndim == 3 else 0
     tile_map = {
         (0, 0, 0, 0, 0): [
-            DummyTile(yx_position=(0, 0), data=tiles[0][..., :15]),
-            DummyTile(yx_position=(0, 5), data=tiles[1][..., 5:]),
+            DummyTile(yx_position=(0, 0), data=tiles[0][z, ..., :15]),
+            DummyTile(yx_position=(0, 5), data=tiles[1][z, ..., 5:]),
         ],
         (1, 0, 0, 0, 0): [],
     }
@@ -209,89 +327,62 @@ def test_translate_3d_tiles_2d(tiles):
         block_info=block_info,
         chunk_shape=(1, 10, 20),
         tiles=tile_map[(0, 0, 0, 0, 0)],
+        build_acquisition_mask=build_acquisition_mask,
     )
 
     assert warped_tiles.shape == (2, 1, 10, 20)
     assert warped_masks.shape == (2, 1, 10, 20)
 
-    assert warped_tiles.dtype == np.uint16
     assert warped_masks.dtype == bool
+    if build_acquisition_mask:
+        assert warped_tiles.dtype == bool
+        assert_array_equal(warped_tiles[0], tiles[0] > 0)
+        assert_array_equal(warped_tiles[1], tiles[1] > 0)
+    else:
+        assert warped_tiles.dtype == np.uint16
+        assert_array_equal(warped_tiles[0], tiles[0])
+        assert_array_equal(warped_tiles[1], tiles[1])
 
-    assert_array_equal(warped_tiles[0], tiles[0])
-    assert_array_equal(warped_tiles[1], tiles[1])
-
-
-def test_translate_2d_tiles_2d(tiles):
-    tile_map = {
-        (0, 0, 0, 0, 0): [
-            DummyTile(yx_position=(0, 0), data=tiles[0][0, ..., :15]),
-            DummyTile(yx_position=(0, 5), data=tiles[1][0, ..., 5:]),
-        ],
-        (1, 0, 0, 0, 0): [],
-    }
 
+def test_translate_tiles_2d_no_tiles():
     block_info = {
         None: {
             "array-location": [(0, 1), (0, 1), (0, 1), (0, 10), (0, 20)],
-            "chunk-location": (0, 0, 0, 0, 0),
-            "chunk-shape": (1, 1, 1, 10, 20),
-            "dtype": "uint16",
-            "num-chunks": (1, 1, 1, 1, 1),
-            "shape": (1, 1, 1, 10, 20),
         }
     }
 
     warped_tiles, warped_masks = translate_tiles_2d(
         block_info=block_info,
         chunk_shape=(1, 10, 20),
-        tiles=tile_map[(0, 0, 0, 0, 0)],
+        tiles=[],
     )
 
-    assert warped_tiles.shape == (2, 1, 10, 20)
-    assert warped_masks.shape == (2, 1, 10, 20)
-
-    assert warped_tiles.dtype == np.uint16
+    assert warped_tiles.shape == (0, 1, 10, 20)
+    assert warped_masks.shape == (0, 1, 10, 20)
     assert warped_masks.dtype == bool
 
-    assert_array_equal(warped_tiles[0], tiles[0])
-    assert_array_equal(warped_tiles[1], tiles[1])
-
-
-def test_translate_2d_tiles_2d_data_mask(tiles):
-    tile_map = {
-        (0, 0, 0, 0, 0): [
-            DummyTile(yx_position=(0, 0), data=tiles[0][0, ..., :15]),
-            DummyTile(yx_position=(0, 5), data=tiles[1][0, ..., 5:]),
-        ],
-        (1, 0, 0, 0, 0): [],
-    }
 
+def test_translate_tiles_2d_exact_fit(tiles):
     block_info = {
         None: {
-            "array-location": [(0, 1), (0, 1), (0, 1), (0, 10), (0, 20)],
-            "chunk-location": (0, 0, 0, 0, 0),
-            "chunk-shape": (1, 1, 1, 10, 20),
-            "dtype": "uint16",
-            "num-chunks": (1, 1, 1, 1, 1),
-            "shape": (1, 1, 1, 10, 20),
+            "array-location": [(0, 1), (0, 1), (0, 1), (10, 20), (20, 40)],
         }
     }
+    tile = DummyTile(yx_position=(10, 20), data=tiles[0])
 
     warped_tiles, warped_masks = translate_tiles_2d(
         block_info=block_info,
         chunk_shape=(1, 10, 20),
-        tiles=tile_map[(0, 0, 0, 0, 0)],
-        build_acquisition_mask=True,
+        tiles=[tile],
     )
 
-    assert warped_tiles.shape == (2, 1, 10, 20)
-    assert warped_masks.shape == (2, 1, 10, 20)
-
-    assert warped_tiles.dtype == bool
-    assert warped_masks.dtype == bool
-
-    assert_array_equal(warped_tiles[0], tiles[0] > 0)
-    assert_array_equal(warped_tiles[1], tiles[1] > 0)
+    assert warped_tiles.shape == (1, 1, 10, 20)
+    assert warped_tiles.flags.writeable
+    assert not np.shares_memory(warped_tiles, tiles)
+    assert_array_equal(warped_tiles[0], tiles[0])
+    assert warped_masks.shape == (1, 1, 10, 20)
+    assert warped_masks.flags.writeable
+    assert warped_masks.all()
 
 
 def test_warp_yx():
@@ -358,3 +449,13 @@ def test_warp_yx():
     expected_warped_tile = np.zeros((1, 3, 3))
     assert_array_equal(warped_tile, expected_warped_tile)
     assert_array_equal(warped_mask, expected_warped_tile == 1)
+
+    warped_tile, warped_mask = shift_yx(
+        chunk_zyx_origin=np.array((0, 0, 0)),
+        tile_data=np.ones((1, 5, 5)),
+        tile_origin=np.array((0, 0, 6)),
+        chunk_shape=chunk_shape,
+    )
+    expected_warped_tile = np.zeros((1, 3, 3))
+    assert_array_equal(warped_tile, expected_warped_tile)
+    assert_array_equal(warped_mask, expected_warped_tile == 1)
@@ -1,20 +1,30 @@
+from functools import lru_cache
+
 import numpy as np
 import pytest
 
-from faim_ipa.MetaSeriesUtils_dask import fuse_fw, fuse_random_gradient, fuse_rev
+from numpy.testing import assert_array_equal
+
+from faim_ipa.MetaSeriesUtils_dask import (
+    fuse_fw,
+    fuse_random_gradient,
+    fuse_rev,
+    get_distance_mask,
+)
 
 
+@lru_cache(maxsize=None)
 def tiles():
-    fake_tiles = [
-        np.ones((8, 8), dtype=np.uint8),
-        np.ones((8, 8), dtype=np.uint8) + 1,
-        np.ones((8, 8), dtype=np.uint8) + 2,
-    ]
-    return np.stack(fake_tiles, axis=0)
+    # Three constant 8x8 tiles with values 1, 2 and 3 (read-only view).
+    values = np.arange(1, 4, dtype=np.uint8)
+    return np.broadcast_to(values[:, np.newaxis, np.newaxis], (3, 8, 8))
 
 
+@lru_cache(maxsize=None)
 def positions():
-    return np.array([[0, 0], [0, 4], [3, 1]])
+    positions = np.array([[0, 0], [0, 4], [3, 1]])
+    positions.setflags(write=False)
+    return positions
 
 
 @pytest.mark.parametrize(
@@ -67,6 +77,8 @@ def test_fuse_fw(tiles, positions):
 )
 def test_fuse_random_gradient(tiles, positions):
     fused_result = fuse_random_gradient(tiles=tiles, positions=positions)
+    # tiles are summed up, which widens the dtype
+    assert fused_result.dtype == tiles.sum().dtype
     # should be the same for all fuse-functions:
     assert fused_result.shape == (11, 12)
     assert fused_result[2, 3] == 1
@@ -78,3 +90,24 @@ def test_fuse_random_gradient(tiles, positions):
     assert fused_result[3, 7] == 1
     assert fused_result[7, 4] == 3
     assert fused_result[7, 7] == 3
+
+
+def test_get_distance_mask():
+    expected = np.array(
+        [
+            [1, 1, 1, 1, 1, 1],
+            [1, 2, 2, 2, 2, 1],
+            [1, 2, 3, 3, 2, 1],
+            [1, 2, 2, 2, 2, 1],
+            [1, 1, 1, 1, 1, 1],
+        ]
+    )
+    dist_map = get_distance_mask((5, 6))
+    assert dist_map.dtype == np.uint16
+    assert_array_equal(dist_map, expected)
+    assert not dist_map.flags.writeable
+    assert get_distance_mask((5, 6)) is dist_map
+
+    # tiles without interior pixels are border everywhere
+    for shape in [(1, 6), (2, 6), (5, 2)]:
+        assert_array_equal(get_distance_mask(shape), np.broadcast_to(1, shape))
@@ -0,0 +1,112 @@
+import pytest
+
+etree = pytest.importorskip("lxml.etree")
+
+from faim_ipa.io.ChannelMetadata import ChannelMetadata  # noqa: E402
+from faim_ipa.visiview.ome_companion_utils import (  # noqa: E402
+    get_channels,
+    get_stage_positions,
+    get_yx_spacing,
+    get_z_spacing,
+    parse_basic_metadata,
+)
+
+COMPANION = """<?xml version="1.0" encoding="UTF-8"?>
+<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2016-06">
+  <Image ID="Image:0">
+    <ObjectiveSettings ID="Objective:0"/>
+    <StageLabel X="10.0" Y="20.0"/>
+    <Pixels PhysicalSizeX="0.16" PhysicalSizeY="0.16">
+      <Channel ID="Channel:0:0" Name="GFP" EmissionWavelength="520"/>
+      <Channel ID="Channel:0:1" Name="RFP" EmissionWavelength="610"/>
+      <Plane PositionZ="0.0" ExposureTime="100.0" ExposureTimeUnit="ms"/>
+      <Plane PositionZ="0.5" ExposureTime="100.0" ExposureTimeUnit="ms"/>
+    </Pixels>
+  </Image>
+  <Image ID="Image:1">
+    <ObjectiveSettings ID="Objective:0"/>
+    <StageLabel X="30.0" Y="40.0"/>
+    <Pixels PhysicalSizeX="0.16" PhysicalSizeY="0.16">
+      <Channel ID="Channel:1:0" Name="GFP" EmissionWavelength="520"/>
+      <Channel ID="Channel:1:1" Name="RFP" EmissionWavelength="610"/>
+      <Plane PositionZ="0.0" ExposureTime="100.0" ExposureTimeUnit="ms"/>
+      <Plane PositionZ="0.5" ExposureTime="100.0" ExposureTimeUnit="ms"/>
+    </Pixels>
+  </Image>
+</OME>
+"""
+
+
+@pytest.fixture
+def companion_file(tmp_path):
+    path = tmp_path / "acquisition.companion.ome"
+    path.write_text(COMPANION)
+    return path
+
+
+def test_get_helpers(companion_file):
+    root = etree.parse(str(companion_file)).getroot()
+    assert get_z_spacing(root) == 0.5
+    assert get_yx_spacing(root) == (0.16, 0.16)
+    assert get_stage_positions(root) == {"1": (20.0, 10.0), "2": (40.0, 30.0)}
+
+    channels = get_channels(root)
+    assert list(channels.keys()) == ["w1", "w2"]
+    assert channels["w1"] == ChannelMetadata(
+        channel_index=0,
+        channel_name="GFP",
+        display_color="35ff00",
+        spatial_calibration_x=0.16,
+        spatial_calibration_y=0.16,
+        spatial_calibration_units="um",
+        z_spacing=0.5,
+        wavelength=520,
+        exposure_time=100.0,
+        exposure_time_unit="ms",
+        objective="Objective:0",
+    )
+    assert channels["w2"].channel_name == "RFP"
+    assert channels["w2"].wavelength == 610
+
+
+def test_parse_basic_metadata(companion_file):
+    assert parse_basic_metadata(companion_file) == {
+        "z_spacing": 0.5,
+        "yx_spacing": (0.16, 0.16),
+        "channels": {
+            "w1": ChannelMetadata(
+                channel_index=0,
+                channel_name="GFP",
+                display_color="35ff00",
+                spatial_calibration_x=0.16,
+                spatial_calibration_y=0.16,
+                spatial_calibration_units="um",
+                z_spacing=0.5,
+                wavelength=520,
+                exposure_time=100.0,
+                exposure_time_unit="ms",
+                objective="Objective:0",
+            ),
+            "w2": ChannelMetadata(
+                channel_index=1,
+                channel_name="RFP",
+                display_color="ff9b00",
+                spatial_calibration_x=0.16,
+                spatial_calibration_y=0.16,
+                spatial_calibration_units="um",
+                z_spacing=0.5,
+                wavelength=610,
+                exposure_time=100.0,
+                exposure_time_unit="ms",
+                objective="Objective:0",
+            ),
+        },
+        "stage_positions": {"1": (20.0, 10.0), "2": (40.0, 30.0)},
+    }
+
+    # The file is read again on every call, changes are picked up.
+    companion_file.write_text(COMPANION.replace('Y="40.0"', 'Y="50.0"'))
+    assert parse_basic_metadata(companion_file)["stage_positions"]["2"] == (
+        50.0,
+        30.0,
+    )